@@ -8,15 +8,23 @@ import voluptuous as vol
 
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
     CONF_ADDRESS,
+    CONF_NAME,
     CONF_SCAN_INTERVAL,
+    DATA_ADDRESS_MAP,
+    DATA_ADVERTISEMENT_UNSUB,
+    DATA_ENTITY_MAP,
+    DATA_SERVICE_REGISTERED,
+    DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     SERVICE_OPEN_TIMED,
+    UUID_ADVERTISED_SERVICE,
 )
 from .coordinator import GalconCoordinator
 from .galcon_device import GalconDevice
@@ -35,10 +43,38 @@ OPEN_TIMED_SCHEMA = vol.Schema(
 )
 
 
+@callback
+def _async_register_advertisement_callback(hass: HomeAssistant) -> CALLBACK_TYPE:
+    """Register the shared BLE advertisement callback for all Galcon devices."""
+    address_map: dict[str, GalconCoordinator] = hass.data[DOMAIN][DATA_ADDRESS_MAP]
+
+    @callback
+    def _update_ble_device(
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Keep the coordinator's BLEDevice current from advertisements."""
+        coordinator = address_map.get(service_info.address)
+        if coordinator is None:
+            return
+        coordinator.device.set_ble_device(service_info.device)
+
+    return bluetooth.async_register_callback(
+        hass,
+        _update_ble_device,
+        bluetooth.BluetoothCallbackMatcher(service_uuid=UUID_ADVERTISED_SERVICE),
+        bluetooth.BluetoothScanningMode.ACTIVE,
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Galcon BT from a config entry."""
     _LOGGER.info("Setting up Galcon BT integration for %s", entry.data.get(CONF_ADDRESS))
     hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN].setdefault(DATA_ENTITY_MAP, {})
+    hass.data[DOMAIN].setdefault(DATA_SERVICE_REGISTERED, False)
+    hass.data[DOMAIN].setdefault(DATA_ADDRESS_MAP, {})
+    hass.data[DOMAIN].setdefault(DATA_ADVERTISEMENT_UNSUB, None)
 
     address = entry.data[CONF_ADDRESS]
     scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
@@ -53,25 +89,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         _LOGGER.debug("No BLEDevice cached for %s, will use MAC address fallback", address)
 
-    # Listen for future BLE advertisements to keep BLEDevice reference fresh
-    @callback
-    def _update_ble_device(
-        service_info: bluetooth.BluetoothServiceInfoBleak,
-        change: bluetooth.BluetoothChange,
-    ) -> None:
-        """Update the BLEDevice when HA's scanner sees the Galcon device."""
-        device.set_ble_device(service_info.device)
+    coordinator = GalconCoordinator(
+        hass, device, scan_interval, entry.data.get(CONF_NAME, DEFAULT_NAME)
+    )
 
+    # Keep the BLEDevice reference fresh from future advertisements; one
+    # integration-wide callback dispatches to coordinators by address
+    address_map = hass.data[DOMAIN][DATA_ADDRESS_MAP]
+    address_map[address] = coordinator
+    entry.async_on_unload(lambda: address_map.pop(address, None))
     entry.async_on_unload(
-        bluetooth.async_register_callback(
-            hass,
-            _update_ble_device,
-            bluetooth.BluetoothCallbackMatcher(address=address),
-            bluetooth.BluetoothScanningMode.ACTIVE,
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, coordinator.async_handle_stop
         )
     )
-
-    coordinator = GalconCoordinator(hass, device, scan_interval)
+    if hass.data[DOMAIN][DATA_ADVERTISEMENT_UNSUB] is None:
+        hass.data[DOMAIN][DATA_ADVERTISEMENT_UNSUB] = (
+            _async_register_advertisement_callback(hass)
+        )
 
     # Polling starts disabled (battery saver). The user enables it via
     # the "Polling" toggle switch in the UI.  We still need to
@@ -90,28 +125,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         minutes = call.data.get("minutes", 0)
         seconds = call.data.get("seconds", 0)
 
-        # Find the coordinator for this entity
-        for eid, coord in hass.data[DOMAIN].items():
-            if isinstance(coord, GalconCoordinator):
-                # We'll let the switch entity handle the actual command
-                await coord.async_open_valve(
-                    hours=hours, minutes=minutes, seconds=seconds
-                )
-                _LOGGER.info(
-                    "Timed valve open: %s for %02d:%02d:%02d",
-                    entity_id,
-                    hours,
-                    minutes,
-                    seconds,
-                )
-                return
-
-        _LOGGER.error("Could not find Galcon device for entity %s", entity_id)
-
-    if not hass.services.has_service(DOMAIN, SERVICE_OPEN_TIMED):
+        # Find the coordinator that owns this entity
+        coord = hass.data[DOMAIN][DATA_ENTITY_MAP].get(entity_id)
+        if coord is None:
+            _LOGGER.error("Could not find Galcon device for entity %s", entity_id)
+            return
+
+        if not await coord.async_open_valve(
+            hours=hours, minutes=minutes, seconds=seconds
+        ):
+            raise HomeAssistantError(f"Failed to open Galcon valve {entity_id}")
+        _LOGGER.info(
+            "Timed valve open: %s for %02d:%02d:%02d",
+            entity_id,
+            hours,
+            minutes,
+            seconds,
+        )
+
+    if not hass.data[DOMAIN][DATA_SERVICE_REGISTERED]:
         hass.services.async_register(
             DOMAIN, SERVICE_OPEN_TIMED, handle_open_timed, schema=OPEN_TIMED_SCHEMA
         )
+        hass.data[DOMAIN][DATA_SERVICE_REGISTERED] = True
 
     return True
 
@@ -120,10 +156,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: GalconCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.device.disconnect()
 
         # Remove service if no more entries
-        if not hass.data[DOMAIN]:
+        if not any(
+            isinstance(coord, GalconCoordinator) for coord in hass.data[DOMAIN].values()
+        ):
             hass.services.async_remove(DOMAIN, SERVICE_OPEN_TIMED)
+            hass.data[DOMAIN][DATA_SERVICE_REGISTERED] = False
+            if (unsub := hass.data[DOMAIN][DATA_ADVERTISEMENT_UNSUB]) is not None:
+                unsub()
+                hass.data[DOMAIN][DATA_ADVERTISEMENT_UNSUB] = None
 
     return unload_ok
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
 from bleak import BleakScanner
 
 from homeassistant import config_entries
+from homeassistant.components import bluetooth
 from homeassistant.const import CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
+    BLE_SCAN_GRACE,
     BLE_SCAN_TIMEOUT,
     CONF_ADDRESS,
     CONF_DURATION,
@@ -24,6 +28,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$")
+
 
 class GalconBTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Galcon BT."""
@@ -34,23 +40,49 @@ class GalconBTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._discovered_devices: dict[str, str] = {}  # address -> name
 
+    def _cached_galcon_devices(self) -> dict[str, str]:
+        """Return Galcon devices already seen by HA's bluetooth scanner.
+
+        Returns a dict of {address: name} for matching devices.
+        """
+        return {
+            service_info.address.upper(): service_info.name
+            for service_info in bluetooth.async_discovered_service_info(
+                self.hass, connectable=True
+            )
+            if DEVICE_NAME_FILTER in (service_info.name or "").upper()
+        }
+
     async def _scan_for_galcon_devices(self) -> dict[str, str]:
         """Scan BLE for devices whose name contains DEVICE_NAME_FILTER.
 
         Returns a dict of {address: name} for matching devices.
+        The scan stops shortly after the first match instead of always
+        running for the full BLE_SCAN_TIMEOUT.
         """
         devices: dict[str, str] = {}
-        try:
-            discovered = await BleakScanner.discover(
-                timeout=BLE_SCAN_TIMEOUT,
-                return_adv=False,
-            )
-            for d in discovered:
-                bt_name = d.name or ""
-                if DEVICE_NAME_FILTER.upper() in bt_name.upper():
-                    addr = d.address.upper()
-                    devices[addr] = bt_name
+        found = asyncio.Event()
+
+        def _on_detection(device, advertisement_data) -> None:
+            bt_name = advertisement_data.local_name or device.name or ""
+            if DEVICE_NAME_FILTER in bt_name.upper():
+                addr = device.address.upper()
+                if addr not in devices:
                     _LOGGER.debug("Found Galcon device: %s (%s)", bt_name, addr)
+                devices[addr] = bt_name
+                found.set()
+
+        try:
+            scanner = BleakScanner(detection_callback=_on_detection)
+            await scanner.start()
+            try:
+                await asyncio.wait_for(found.wait(), timeout=BLE_SCAN_TIMEOUT)
+                # Short grace window to pick up additional units
+                await asyncio.sleep(BLE_SCAN_GRACE)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                await scanner.stop()
         except Exception as err:
             _LOGGER.error("BLE scan failed: %s", err)
         return devices
@@ -79,8 +111,20 @@ class GalconBTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        # Scan for devices
-        self._discovered_devices = await self._scan_for_galcon_devices()
+        # Prefer HA's advertisement cache; only run our own scan if it has
+        # no device that isn't configured yet
+        configured = self._async_current_ids()
+        self._discovered_devices = {
+            addr: name
+            for addr, name in self._cached_galcon_devices().items()
+            if addr not in configured
+        }
+        if not self._discovered_devices:
+            self._discovered_devices = {
+                addr: name
+                for addr, name in (await self._scan_for_galcon_devices()).items()
+                if addr not in configured
+            }
 
         if not self._discovered_devices:
             # No devices found — fall back to manual entry
@@ -117,8 +161,7 @@ class GalconBTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             address = user_input[CONF_ADDRESS].strip().upper()
 
-            import re
-            if not re.match(r"^([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$", address):
+            if not _MAC_RE.match(address):
                 errors[CONF_ADDRESS] = "invalid_address"
             else:
                 await self.async_set_unique_id(address)
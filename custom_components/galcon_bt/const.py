@@ -8,32 +8,67 @@ UUID_STATUS = "e8680102-9c4b-11e4-b5f7-0002a5d5c51b"
 UUID_CONTROL = "e8680103-9c4b-11e4-b5f7-0002a5d5c51b"
 UUID_PIN = "e8680401-9c4b-11e4-b5f7-0002a5d5c51b"
 
+# Service UUID advertised by the Galcon 9001BT (also used in manifest.json)
+UUID_ADVERTISED_SERVICE = "e8680100-9c4b-11e4-b5f7-0002a5d5c51b"
+
 # Config keys
 CONF_ADDRESS = "address"
 CONF_NAME = "name"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_DURATION = "duration"
 
+# Valve entity state attribute keys
+ATTR_BLUETOOTH_ADDRESS = "bluetooth_address"
+ATTR_CONSECUTIVE_POLL_FAILURES = "consecutive_poll_failures"
+ATTR_LAST_SEEN = "last_seen"
+ATTR_MANUAL_OPEN = "manual_open"
+ATTR_HOURS_REMAINING = "hours_remaining"
+ATTR_MINUTES_REMAINING = "minutes_remaining"
+ATTR_SECONDS_REMAINING = "seconds_remaining"
+ATTR_TIME_REMAINING_TOTAL_SECONDS = "time_remaining_total_seconds"
+ATTR_RAW_STATUS = "raw_status"
+
 # Defaults
 DEFAULT_NAME = "Galcon Irrigation"
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
 DEFAULT_DURATION = 20  # minutes
 
-# BLE device name filter — the Galcon 9001BT advertises with this prefix
+# BLE device name filter — the Galcon 9001BT advertises with this prefix.
+# Kept uppercase so it can be matched against name.upper() without re-casing.
 DEVICE_NAME_FILTER = "GL9001A"
 BLE_SCAN_TIMEOUT = 10.0  # seconds to scan for devices during setup
+BLE_SCAN_GRACE = 1.0  # seconds to keep scanning after the first match
 
 # Connection
 MAX_RETRIES = 3
 CONNECT_TIMEOUT = 30.0  # seconds (Galcon BLE is slow to wake)
+IDLE_DISCONNECT_DELAY = 30.0  # seconds an unused connection is kept open
 COMMAND_VERIFY_ATTEMPTS = 3  # write+verify cycles per connection
+# Upper bound for the device exchange of one valve command (not time queued on
+# the command lock); leaves room for MAX_RETRIES slow connection attempts
+COMMAND_TIMEOUT = 90.0  # seconds
 WAKE_SETTLE_DELAY = 1.0  # seconds after wake-up before first command
-POST_COMMAND_DELAY = 1.5  # seconds after write before reading status back
+# A status read this recently is trusted for "already in state" checks
+STATUS_FRESH_FOR = 5.0  # seconds
+
+# Read-back verification after a command: first probe, max gap, overall limit
+VERIFY_INITIAL_DELAY = 0.1  # seconds
+VERIFY_MAX_DELAY = 0.6  # seconds
+VERIFY_TIMEOUT = 3.0  # seconds
+STATUS_NOTIFY_TIMEOUT = 3.0  # seconds to wait for a status notification after a write
+CONFIRMED_STATE_DURATION = 2.0  # seconds the "Confirmed" status shows before Idle
 
 # Availability: mark unavailable only after this many consecutive poll failures.
 # BLE devices sleep and frequently miss polls — this prevents constant gray-out.
 MAX_CONSECUTIVE_FAILURES = 5
 
+# While a locally started irrigation has more than this many seconds left, the
+# remaining time is computed locally instead of read over GATT.
+LOCAL_COUNTDOWN_MIN_REMAINING = 60
+
+# Poll interval doubles after each consecutive failure, capped at this value
+MAX_BACKOFF_INTERVAL = 3600  # 1 hour
+
 # Control byte constants
 CMD_CLOSE_VALVE = b"\x01\x00\x00\x00\x00\x00\x00"
 CMD_OPEN_VALVE = b"\x00\x01\x00\x00\x00\x00\x00"
@@ -43,5 +78,17 @@ WAKE_PAYLOAD = b"\x01\x02"
 STATUS_VALVE_OPEN_MASK = 0x01
 STATUS_MANUAL_OPEN_MASK = 0x01  # Byte 1
 
+# hass.data[DOMAIN] key for the entity_id -> coordinator map used by services
+DATA_ENTITY_MAP = "entity_map"
+# hass.data[DOMAIN] key for the BLE address -> coordinator map used by the
+# shared advertisement callback, and for that callback's unsubscribe function
+DATA_ADDRESS_MAP = "address_to_coordinator"
+DATA_ADVERTISEMENT_UNSUB = "_advertisement_unsub"
+# hass.data[DOMAIN] flag set once the integration services are registered
+DATA_SERVICE_REGISTERED = "_service_registered"
+
+# Dispatcher signal sent when a coordinator's operation state changes
+SIGNAL_OPERATION_STATE = f"{DOMAIN}_{{}}_opstate"
+
 # Service names
 SERVICE_OPEN_TIMED = "open_valve_timed"
@@ -2,57 +2,125 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable
 from datetime import datetime, timedelta
-from enum import StrEnum
+from typing import Final
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, MAX_CONSECUTIVE_FAILURES
+from .const import (
+    COMMAND_TIMEOUT,
+    CONFIRMED_STATE_DURATION,
+    DATA_ENTITY_MAP,
+    DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    LOCAL_COUNTDOWN_MIN_REMAINING,
+    MAX_BACKOFF_INTERVAL,
+    MAX_CONSECUTIVE_FAILURES,
+    SIGNAL_OPERATION_STATE,
+)
 from .galcon_device import GalconDevice, GalconStatus
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared all-zero status used before the device has ever been read.
+# GalconStatus is immutable, so a single instance can be reused safely.
+_SYNTHETIC_STATUS = GalconStatus(
+    valve_open=False,
+    manual_open=False,
+    hours_remaining=0,
+    minutes_remaining=0,
+    seconds_remaining=0,
+    raw=b"",
+)
 
-class OperationState(StrEnum):
-    """Visual states for the Galcon device operation."""
 
-    IDLE = "Idle"
-    CONNECTING = "Connecting..."
-    OPENING = "Opening..."
-    CLOSING = "Closing..."
-    VERIFYING = "Verifying..."
-    CONFIRMED = "Confirmed"
-    ERROR = "Error"
-    SCANNING = "Scanning..."
+# ":" -> "_" and hex digits lowercased in a single pass; addresses are hex
+_SLUG_TRANSLATION = str.maketrans(":ABCDEF", "_abcdef")
+
+
+def _address_slug(address: str) -> str:
+    """Return the unique_id slug for a Bluetooth address."""
+    return address.translate(_SLUG_TRANSLATION)
+
+
+class OperationState:
+    """Visual states for the Galcon device operation (plain strings)."""
+
+    IDLE: Final = "Idle"
+    CONNECTING: Final = "Connecting..."
+    OPENING: Final = "Opening..."
+    CLOSING: Final = "Closing..."
+    VERIFYING: Final = "Verifying..."
+    CONFIRMED: Final = "Confirmed"
+    ERROR: Final = "Error"
+    SCANNING: Final = "Scanning..."
 
 
 class GalconCoordinator(DataUpdateCoordinator[GalconStatus]):
     """Coordinator that polls status from the Galcon device periodically."""
 
     def __init__(
-        self, hass: HomeAssistant, device: GalconDevice, scan_interval: int | None = None
+        self,
+        hass: HomeAssistant,
+        device: GalconDevice,
+        scan_interval: int | None = None,
+        name: str = DEFAULT_NAME,
     ) -> None:
         """Initialize the coordinator."""
         self.device = device
+        # Shared by all entities of this device for their unique_ids
+        self.address_slug = _address_slug(device.address)
+        # One device_info dict shared by every entity of this device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.address)},
+            name=name,
+            manufacturer="Galcon",
+            model="9001BT",
+            connections={("bluetooth", device.address)},
+        )
         self.consecutive_failures: int = 0
-        self.last_successful_poll: datetime | None = None
+        # Poll time and its ISO string, formatted once per successful poll
+        self._last_successful_poll: datetime | None = None
+        self.last_successful_poll_iso: str | None = None
         self._last_known_status: GalconStatus | None = None
         self.polling_enabled: bool = False
         self._base_interval = scan_interval or DEFAULT_SCAN_INTERVAL
-        self.duration_minutes: int = 20  # overridden by NumberEntity on setup
+        # Duration split into H:M:S once per change, for open commands
+        self._duration_minutes: int = 0
+        self.duration_hms: tuple[int, int, int] = (0, 0, 0)
+        self.duration_label: str = "00:00:00"
+        self.duration_minutes = 20  # overridden by NumberEntity on setup
 
         # Last irrigation tracking
         self.last_irrigation_start: datetime | None = None
         self.last_irrigation_duration_min: int | None = None
         self._current_irrigation_start: datetime | None = None
         self._current_irrigation_duration: int = 0
+        # loop.time() at which the device-reported remaining time runs out
+        self._countdown_deadline: float | None = None
 
         # Operation state tracking for UI feedback
-        self.operation_state: OperationState = OperationState.IDLE
-        self._state_listeners: list = []
+        self.operation_state: str = OperationState.IDLE
+        self._idle_reset_handle: asyncio.TimerHandle | None = None
+        self.operation_state_signal = SIGNAL_OPERATION_STATE.format(device.address)
+
+        # Shared 1 Hz tick for countdown entities, running only while subscribed
+        self._tick_listeners: list[Callable[[], None]] = []
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+        # Serializes valve commands so concurrent callers don't race on BLE
+        self._command_lock = asyncio.Lock()
+        # Set on EVENT_HOMEASSISTANT_STOP; no new BLE work is started after
+        self._stopping = False
 
         super().__init__(
             hass,
@@ -61,14 +129,96 @@ class GalconCoordinator(DataUpdateCoordinator[GalconStatus]):
             update_interval=timedelta(seconds=self._base_interval),
         )
 
-    def register_state_listener(self, listener) -> None:
-        """Register a callback to be called when operation_state changes."""
-        self._state_listeners.append(listener)
+    def _set_operation_state(self, state: str) -> None:
+        """Update operation state and notify subscribed sensor entities.
 
-    def _set_operation_state(self, state: OperationState) -> None:
-        """Update operation state and notify listeners (sensor entities)."""
+        CONFIRMED automatically settles back to IDLE after
+        CONFIRMED_STATE_DURATION; any other transition cancels that reset.
+        """
+        if self._idle_reset_handle is not None:
+            self._idle_reset_handle.cancel()
+            self._idle_reset_handle = None
         self.operation_state = state
-        for listener in self._state_listeners:
+        async_dispatcher_send(self.hass, self.operation_state_signal)
+        if state == OperationState.CONFIRMED:
+            self._idle_reset_handle = self.hass.loop.call_later(
+                CONFIRMED_STATE_DURATION,
+                self._set_operation_state,
+                OperationState.IDLE,
+            )
+
+    @property
+    def duration_minutes(self) -> int:
+        """Return the configured irrigation duration in minutes."""
+        return self._duration_minutes
+
+    @duration_minutes.setter
+    def duration_minutes(self, value: int) -> None:
+        """Set the duration and precompute its H:M:S split for commands."""
+        self._duration_minutes = value
+        hours, remainder = divmod(value * 60, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        self.duration_hms = (hours, minutes, seconds)
+        self.duration_label = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    @property
+    def last_successful_poll(self) -> datetime | None:
+        """Return the time of the last successful GATT poll."""
+        return self._last_successful_poll
+
+    @last_successful_poll.setter
+    def last_successful_poll(self, value: datetime | None) -> None:
+        """Set the poll time and format its ISO string once for entities."""
+        self._last_successful_poll = value
+        self.last_successful_poll_iso = (
+            value.isoformat() if value is not None else None
+        )
+
+    @callback
+    def async_register_entity(self, entity_id: str) -> CALLBACK_TYPE:
+        """Map an entity to this coordinator for the timed-open service.
+
+        Returns a callback that removes the mapping again.
+        """
+        entity_map: dict[str, GalconCoordinator] = self.hass.data[DOMAIN][
+            DATA_ENTITY_MAP
+        ]
+        entity_map[entity_id] = self
+
+        @callback
+        def _unregister() -> None:
+            entity_map.pop(entity_id, None)
+
+        return _unregister
+
+    @callback
+    def async_handle_stop(self, _event: Event) -> None:
+        """Stop starting BLE operations once Home Assistant shuts down."""
+        self._stopping = True
+
+    @callback
+    def async_add_tick_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Subscribe to the shared 1 Hz tick; returns an unsubscribe callback."""
+        self._tick_listeners.append(listener)
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=1)
+            )
+
+        @callback
+        def _remove_listener() -> None:
+            if listener in self._tick_listeners:
+                self._tick_listeners.remove(listener)
+            if not self._tick_listeners and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
+
+        return _remove_listener
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Fan the shared tick out to subscribed entities."""
+        for listener in list(self._tick_listeners):
             listener()
 
     @property
@@ -88,21 +238,46 @@ class GalconCoordinator(DataUpdateCoordinator[GalconStatus]):
             self._set_operation_state(OperationState.IDLE)
             _LOGGER.info("Galcon %s: scanning DISABLED", self.device.address)
 
+    def _local_countdown_status(self) -> GalconStatus | None:
+        """Return a locally computed status while our irrigation timer runs.
+
+        The countdown is anchored to the remaining time the device last
+        reported, not to the duration we asked for. Returns None when there
+        is no active irrigation started by us, or when it is close enough
+        to the end that the device should be read.
+        """
+        if (
+            self._current_irrigation_start is None
+            or self._countdown_deadline is None
+            or self._last_known_status is None
+        ):
+            return None
+        remaining = int(self._countdown_deadline - self.hass.loop.time())
+        if remaining <= LOCAL_COUNTDOWN_MIN_REMAINING:
+            return None
+        hours, remainder = divmod(remaining, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return self._last_known_status._replace(
+            hours_remaining=hours,
+            minutes_remaining=minutes,
+            seconds_remaining=seconds,
+        )
+
     async def _async_update_data(self) -> GalconStatus:
         """Fetch status from the Galcon device."""
-        if not self.polling_enabled:
-            if self._last_known_status is not None:
-                return self._last_known_status
-            synthetic = GalconStatus(
-                valve_open=False,
-                manual_open=False,
-                hours_remaining=0,
-                minutes_remaining=0,
-                seconds_remaining=0,
-                raw=b"",
+        if not self.polling_enabled or self._stopping:
+            if self._last_known_status is None:
+                self._last_known_status = _SYNTHETIC_STATUS
+            return self._last_known_status
+
+        local_status = self._local_countdown_status()
+        if local_status is not None:
+            _LOGGER.debug(
+                "Galcon %s irrigation countdown running, skipping GATT poll",
+                self.device.address,
             )
-            self._last_known_status = synthetic
-            return synthetic
+            self._last_known_status = local_status
+            return local_status
 
         self._set_operation_state(OperationState.SCANNING)
         try:
@@ -110,25 +285,36 @@ class GalconCoordinator(DataUpdateCoordinator[GalconStatus]):
             self.consecutive_failures = 0
             self.last_successful_poll = dt_util.utcnow()
             self._last_known_status = status
+            self._anchor_countdown(status)
+            self.update_interval = timedelta(seconds=self._base_interval)
             self._set_operation_state(OperationState.IDLE)
-            _LOGGER.info(
-                "Galcon %s status: valve_open=%s, manual=%s, remaining=%02d:%02d:%02d",
-                self.device.address,
-                status.valve_open,
-                status.manual_open,
-                status.hours_remaining,
-                status.minutes_remaining,
-                status.seconds_remaining,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Galcon %s status: valve_open=%s, manual=%s, "
+                    "remaining=%02d:%02d:%02d",
+                    self.device.address,
+                    status.valve_open,
+                    status.manual_open,
+                    status.hours_remaining,
+                    status.minutes_remaining,
+                    status.seconds_remaining,
+                )
             return status
-        except (ConnectionError, Exception) as err:
+        except Exception as err:
             self.consecutive_failures += 1
             self._set_operation_state(OperationState.IDLE)
+            # Back off exponentially so a sleeping device isn't hammered
+            backoff = min(
+                self._base_interval * (2 ** min(self.consecutive_failures, 6)),
+                MAX_BACKOFF_INTERVAL,
+            )
+            self.update_interval = timedelta(seconds=backoff)
             _LOGGER.info(
-                "Galcon %s poll failed (%d/%d consecutive): %s",
+                "Galcon %s poll failed (%d/%d consecutive), next poll in %ds: %s",
                 self.device.address,
                 self.consecutive_failures,
                 MAX_CONSECUTIVE_FAILURES,
+                backoff,
                 err,
             )
             if self._last_known_status is not None:
@@ -137,6 +323,31 @@ class GalconCoordinator(DataUpdateCoordinator[GalconStatus]):
                 f"Cannot reach Galcon device (no cached state): {err}"
             ) from err
 
+    def _cached_or_empty_status(self) -> GalconStatus:
+        """Return the last known status, or an all-zero one if none yet."""
+        if self._last_known_status is not None:
+            return self._last_known_status
+        return _SYNTHETIC_STATUS
+
+    def _closed_status(self) -> GalconStatus:
+        """Return the cached status marked closed, keeping raw/battery."""
+        return self._cached_or_empty_status()._replace(
+            valve_open=False,
+            manual_open=False,
+            hours_remaining=0,
+            minutes_remaining=0,
+            seconds_remaining=0,
+        )
+
+    def _anchor_countdown(self, status: GalconStatus | None) -> None:
+        """Set the local countdown deadline from a device-reported status."""
+        if status is not None and status.valve_open and status.time_remaining_seconds:
+            self._countdown_deadline = (
+                self.hass.loop.time() + status.time_remaining_seconds
+            )
+        else:
+            self._countdown_deadline = None
+
     def _record_irrigation_start(self, duration_minutes: int) -> None:
         """Record the start of an irrigation session."""
         self._current_irrigation_start = dt_util.now()
@@ -157,59 +368,100 @@ class GalconCoordinator(DataUpdateCoordinator[GalconStatus]):
 
     async def async_open_valve(
         self, hours: int = 0, minutes: int = 0, seconds: int = 0
-    ) -> None:
-        """Open the valve with operation state feedback."""
-        self._set_operation_state(OperationState.CONNECTING)
-        try:
+    ) -> bool:
+        """Open the valve with operation state feedback.
+
+        Commands are serialized by the command lock. A repeat open is not
+        filtered here, since the cached status can lag the device; it
+        reaches GalconDevice, whose fresh-status and pre-read checks skip
+        the write if the valve is really open (the running timer is kept).
+        Returns False if the command failed; failures are not raised.
+        """
+        duration_minutes = hours * 60 + minutes + (1 if seconds else 0)
+        async with self._command_lock:
             self._set_operation_state(OperationState.OPENING)
-            real_status = await self.device.open_valve(
-                hours=hours, minutes=minutes, seconds=seconds
-            )
-            self._set_operation_state(OperationState.CONFIRMED)
-            if real_status:
-                # Use the actual device-reported status (has real time remaining)
-                self._last_known_status = real_status
-            else:
-                # Fallback synthetic — command sent but not confirmed
-                self._last_known_status = GalconStatus(
-                    valve_open=True,
-                    manual_open=True,
-                    hours_remaining=hours,
-                    minutes_remaining=minutes,
-                    seconds_remaining=seconds,
-                    raw=self._last_known_status.raw if self._last_known_status else b"",
-                    battery_level=self._last_known_status.battery_level if self._last_known_status else None,
+            try:
+                # Bounded inside the lock so time spent queued isn't counted
+                result = await asyncio.wait_for(
+                    self.device.open_valve(
+                        hours=hours, minutes=minutes, seconds=seconds
+                    ),
+                    timeout=COMMAND_TIMEOUT,
                 )
-            self._record_irrigation_start(hours * 60 + minutes + (1 if seconds else 0))
-            self.async_set_updated_data(self._last_known_status)
-        except (ConnectionError, Exception):
-            self._set_operation_state(OperationState.ERROR)
-            raise
-
-    async def async_close_valve(self) -> None:
-        """Close the valve with operation state feedback."""
-        self._set_operation_state(OperationState.CONNECTING)
-        try:
+                if (real_status := result.status) is not None:
+                    # Use the actual device-reported status (has real time remaining)
+                    self._last_known_status = real_status
+                    self._anchor_countdown(real_status)
+                else:
+                    # Fallback synthetic — command sent but not confirmed
+                    self._last_known_status = self._cached_or_empty_status()._replace(
+                        valve_open=True,
+                        manual_open=True,
+                        hours_remaining=hours,
+                        minutes_remaining=minutes,
+                        seconds_remaining=seconds,
+                    )
+                    # Not device-reported, so poll instead of counting down
+                    self._anchor_countdown(None)
+                # Skipped when the device was already open; that run's
+                # start and duration stay as they were
+                if result.written:
+                    self._record_irrigation_start(duration_minutes)
+                self.async_set_updated_data(self._last_known_status)
+                self._set_operation_state(OperationState.CONFIRMED)
+            except asyncio.CancelledError:
+                self._set_operation_state(OperationState.ERROR)
+                raise
+            except asyncio.TimeoutError:
+                self._command_failed(
+                    "open", f"timed out after {COMMAND_TIMEOUT:.0f} s"
+                )
+                return False
+            except Exception as err:
+                self._command_failed("open", err)
+                return False
+            return True
+
+    async def async_close_valve(self) -> bool:
+        """Close the valve with operation state feedback.
+
+        Returns False if the command failed; failures are not raised.
+        """
+        async with self._command_lock:
             self._set_operation_state(OperationState.CLOSING)
-            real_status = await self.device.close_valve()
-            self._set_operation_state(OperationState.CONFIRMED)
-            self._record_irrigation_end()
-            if real_status:
-                self._last_known_status = real_status
-            else:
-                self._last_known_status = GalconStatus(
-                    valve_open=False,
-                    manual_open=False,
-                    hours_remaining=0,
-                    minutes_remaining=0,
-                    seconds_remaining=0,
-                    raw=self._last_known_status.raw if self._last_known_status else b"",
-                    battery_level=self._last_known_status.battery_level if self._last_known_status else None,
+            try:
+                result = await asyncio.wait_for(
+                    self.device.close_valve(), timeout=COMMAND_TIMEOUT
                 )
-            self.async_set_updated_data(self._last_known_status)
-        except (ConnectionError, Exception):
-            self._set_operation_state(OperationState.ERROR)
-            raise
+                self._record_irrigation_end()
+                if result.status is not None:
+                    self._last_known_status = result.status
+                else:
+                    self._last_known_status = self._closed_status()
+                self._anchor_countdown(None)
+                self.async_set_updated_data(self._last_known_status)
+                self._set_operation_state(OperationState.CONFIRMED)
+            except asyncio.CancelledError:
+                self._set_operation_state(OperationState.ERROR)
+                raise
+            except asyncio.TimeoutError:
+                self._command_failed(
+                    "close", f"timed out after {COMMAND_TIMEOUT:.0f} s"
+                )
+                return False
+            except Exception as err:
+                self._command_failed("close", err)
+                return False
+            return True
+
+    def _command_failed(self, action: str, err: Exception | str) -> None:
+        """Record a failed valve command and surface it to the entities."""
+        self.consecutive_failures += 1
+        self._set_operation_state(OperationState.ERROR)
+        _LOGGER.error(
+            "Galcon %s: failed to %s valve: %s", self.device.address, action, err
+        )
+        self.async_update_listeners()
 
     def async_irrigation_ended(self) -> None:
         """Called when the local countdown reaches zero.
@@ -222,14 +474,7 @@ class GalconCoordinator(DataUpdateCoordinator[GalconStatus]):
             self.device.address,
         )
         self._record_irrigation_end()
-        self._last_known_status = GalconStatus(
-            valve_open=False,
-            manual_open=False,
-            hours_remaining=0,
-            minutes_remaining=0,
-            seconds_remaining=0,
-            raw=self._last_known_status.raw if self._last_known_status else b"",
-            battery_level=self._last_known_status.battery_level if self._last_known_status else None,
-        )
+        self._last_known_status = self._closed_status()
+        self._anchor_countdown(None)
         self.async_set_updated_data(self._last_known_status)
         self.set_polling(False)
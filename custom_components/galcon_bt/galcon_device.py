@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from dataclasses import dataclass
+import struct
+import time
+from typing import NamedTuple
 
 from bleak import BleakClient
 from bleak.backends.device import BLEDevice
@@ -16,23 +19,47 @@ from .const import (
     CMD_OPEN_VALVE,
     COMMAND_VERIFY_ATTEMPTS,
     CONNECT_TIMEOUT,
+    IDLE_DISCONNECT_DELAY,
     MAX_RETRIES,
-    POST_COMMAND_DELAY,
+    STATUS_FRESH_FOR,
+    STATUS_NOTIFY_TIMEOUT,
     STATUS_MANUAL_OPEN_MASK,
     STATUS_VALVE_OPEN_MASK,
     UUID_CONTROL,
     UUID_STATUS,
     UUID_WAKE,
+    VERIFY_INITIAL_DELAY,
+    VERIFY_MAX_DELAY,
+    VERIFY_TIMEOUT,
     WAKE_PAYLOAD,
     WAKE_SETTLE_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Leading status bytes: flags, manual flag, hours, minutes, seconds, battery
+_STATUS_STRUCT = struct.Struct("<6B")
 
-@dataclass
-class GalconStatus:
-    """Parsed status from the Galcon device."""
+# BLE error fragments that clear up on an immediate retry (aborted or
+# in-progress connects), as opposed to a sleeping or out-of-range device
+_TRANSIENT_ERRORS = (
+    "le-connection-abort-by-local",
+    "br-connection-canceled",
+    "In Progress",
+    "ATT error: 0x0e",
+)
+
+# Timed-open command; bytes 3-5 are filled with hours, minutes, seconds
+_OPEN_TIMED_TEMPLATE = bytes((0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00))
+
+
+class GalconStatus(NamedTuple):
+    """Parsed status from the Galcon device.
+
+    Immutable and without an instance __dict__ (fields live in the tuple),
+    so one instance can be shared by the coordinator and every entity.
+    Use _replace() to derive a modified copy.
+    """
 
     valve_open: bool
     manual_open: bool
@@ -41,6 +68,7 @@ class GalconStatus:
     seconds_remaining: int
     raw: bytes
     battery_level: int | None = None  # 0-100%, from byte 5
+    raw_hex: str = ""  # raw.hex(), computed once when the frame is parsed
 
     @property
     def time_remaining_seconds(self) -> int:
@@ -52,6 +80,13 @@ class GalconStatus:
         )
 
 
+class CommandResult(NamedTuple):
+    """Outcome of an open/close command."""
+
+    status: GalconStatus | None  # None if the write was not confirmed
+    written: bool  # False when skipped because the valve was already there
+
+
 class GalconDevice:
     """Manages BLE communication with a Galcon 9001BT irrigation controller."""
 
@@ -65,40 +100,205 @@ class GalconDevice:
         self._lock = asyncio.Lock()
         self._ble_device: BLEDevice | None = None
 
+        # Connection kept open between back-to-back operations
+        self._client: BleakClient | None = None
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._idle_task: asyncio.Task | None = None
+
+        # Status notifications (when the characteristic supports them)
+        self._notify_enabled = False
+        self._status_event = asyncio.Event()
+        self._notified_status: GalconStatus | None = None
+
+        # Most recent status seen on the wire, with its monotonic timestamp
+        self._last_status: GalconStatus | None = None
+        self._last_status_ts: float = 0.0
+
+        # Last raw status frame and its parsed form (idle polls repeat it)
+        self._last_raw: bytes = b""
+        self._last_parsed: GalconStatus | None = None
+
+        # Monotonic time of the last GATT exchange; the device stays awake
+        # for a while after it, so re-waking right away is pointless
+        self._last_activity: float = 0.0
+
+        # Write-without-response support, probed once per connection
+        self._wake_nores = False
+        self._control_nores = False
+        self._session_woken = False
+
+        # Extra read_gatt_char kwargs for the active backend (see _get_client)
+        self._read_kwargs: dict[str, bool] = {}
+
     def set_ble_device(self, ble_device: BLEDevice) -> None:
         """Update the BLEDevice reference (from HA's bluetooth scanner)."""
         self._ble_device = ble_device
 
-    async def _execute(self, callback) -> any:
-        """Connect to the device, execute a callback, and disconnect.
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """Forget the cached client once the device drops the connection."""
+        if client is self._client:
+            _LOGGER.debug("Galcon %s disconnected", self.address)
+            self._client = None
+            self._notify_enabled = False
+            self._cancel_idle_disconnect()
+
+    async def _get_client(self) -> BleakClient:
+        """Return the connected client, connecting if needed.
 
-        Handles retries on BLE errors. The callback receives the BleakClient.
         Uses bleak-retry-connector when a BLEDevice is available (from HA's
         bluetooth scanner), otherwise falls back to raw BleakClient.
         """
+        if self._client is not None and self._client.is_connected:
+            return self._client
+
+        if self._ble_device is not None:
+            client = await establish_connection(
+                BleakClient,
+                self._ble_device,
+                self.address,
+                disconnected_callback=self._on_disconnected,
+                max_attempts=2,
+                # The 9001BT's GATT table is fixed, so reconnects can skip
+                # service discovery
+                use_services_cache=True,
+            )
+        else:
+            client = BleakClient(
+                self.address,
+                disconnected_callback=self._on_disconnected,
+                timeout=CONNECT_TIMEOUT,
+            )
+            await client.connect(dangerous_use_bleak_cache=True)
+        if not client.is_connected:
+            raise BleakError("Failed to connect")
+        self._client = client
+        self._notify_enabled = await self._start_status_notify(client)
+        self._wake_nores = self._supports_write_without_response(client, UUID_WAKE)
+        self._control_nores = self._supports_write_without_response(
+            client, UUID_CONTROL
+        )
+        self._session_woken = False
+        self._read_kwargs = self._uncached_read_kwargs(client)
+        return client
+
+    @staticmethod
+    def _uncached_read_kwargs(client: BleakClient) -> dict[str, bool]:
+        """Return read kwargs that bypass the OS GATT cache on this backend.
+
+        WinRT can serve reads from Windows' attribute cache, which makes a
+        verify read right after a command return the pre-command value.
+        """
+        backend = getattr(client, "_backend", None)
+        if backend is not None and type(backend).__name__ == "BleakClientWinRT":
+            return {"use_cached": False}
+        return {}
+
+    @staticmethod
+    def _supports_write_without_response(client: BleakClient, uuid: str) -> bool:
+        """Return True if the characteristic accepts write-without-response."""
+        char = client.services.get_characteristic(uuid)
+        return char is not None and "write-without-response" in char.properties
+
+    async def _start_status_notify(self, client: BleakClient) -> bool:
+        """Subscribe to status notifications; return False if unsupported."""
+        char = client.services.get_characteristic(UUID_STATUS)
+        if char is None or "notify" not in char.properties:
+            return False
+        try:
+            await client.start_notify(UUID_STATUS, self._on_status_notify)
+        except (BleakError, asyncio.TimeoutError, OSError) as err:
+            _LOGGER.debug(
+                "Status notifications unavailable on %s: %s", self.address, err
+            )
+            return False
+        return True
+
+    def _on_status_notify(self, _sender, data: bytearray) -> None:
+        """Handle a status notification pushed by the device."""
+        self._notified_status = self._remember_status(self._decode_status(data))
+        self._status_event.set()
+
+    async def _wait_for_notified_status(
+        self, expect_open: bool
+    ) -> GalconStatus | None:
+        """Wait for a notification reporting the expected valve state.
+
+        Returns None if none arrives within STATUS_NOTIFY_TIMEOUT.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STATUS_NOTIFY_TIMEOUT
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                await asyncio.wait_for(self._status_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+            self._status_event.clear()
+            status = self._notified_status
+            if status is not None and status.valve_open == expect_open:
+                return status
+        return None
+
+    def _cancel_idle_disconnect(self) -> None:
+        """Cancel a pending idle disconnect."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _schedule_idle_disconnect(self) -> None:
+        """(Re)start the timer that drops the connection once idle."""
+        self._cancel_idle_disconnect()
+        self._idle_handle = asyncio.get_running_loop().call_later(
+            IDLE_DISCONNECT_DELAY, self._on_idle_timeout
+        )
+
+    def _on_idle_timeout(self) -> None:
+        """Disconnect after IDLE_DISCONNECT_DELAY without any operation."""
+        self._idle_handle = None
+        self._idle_task = asyncio.get_running_loop().create_task(
+            self._async_idle_disconnect()
+        )
+
+    async def _async_idle_disconnect(self) -> None:
+        """Disconnect unless an operation has started using the client again."""
+        async with self._lock:
+            if self._idle_handle is None:
+                await self._disconnect()
+
+    async def _disconnect(self) -> None:
+        """Drop the cached connection, if any."""
+        self._cancel_idle_disconnect()
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                await client.disconnect()
+            except (BleakError, asyncio.TimeoutError, OSError) as err:
+                _LOGGER.debug("Galcon %s disconnect failed: %s", self.address, err)
+
+    async def disconnect(self) -> None:
+        """Close the BLE connection (e.g. when the config entry unloads)."""
+        async with self._lock:
+            await self._disconnect()
+
+    async def _execute(self, callback) -> any:
+        """Run a callback against a connected client.
+
+        Handles retries on BLE errors. The callback receives the BleakClient.
+        The connection is reused by operations that follow within
+        IDLE_DISCONNECT_DELAY, then dropped to spare the device's battery.
+        """
         last_error: Exception | None = None
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                if self._ble_device is not None:
-                    client = await establish_connection(
-                        BleakClient,
-                        self._ble_device,
-                        self.address,
-                        max_attempts=2,
-                    )
-                else:
-                    client = BleakClient(
-                        self.address, timeout=CONNECT_TIMEOUT
-                    )
-                    await client.connect()
+                client = await self._get_client()
+                self._cancel_idle_disconnect()
                 try:
-                    if not client.is_connected:
-                        raise BleakError("Failed to connect")
                     return await callback(client)
                 finally:
-                    await client.disconnect()
+                    if self._client is not None:
+                        self._schedule_idle_disconnect()
             except (BleakError, asyncio.TimeoutError, OSError) as err:
                 last_error = err
+                await self._disconnect()
                 _LOGGER.debug(
                     "Galcon BLE attempt %d/%d failed for %s: %s",
                     attempt,
@@ -107,57 +307,127 @@ class GalconDevice:
                     err,
                 )
                 if attempt < MAX_RETRIES:
-                    # Exponential-ish backoff — give the BLE device time to wake
-                    await asyncio.sleep(2.0 * attempt)
+                    message = str(err)
+                    if not any(fragment in message for fragment in _TRANSIENT_ERRORS):
+                        # Short backoff — give the BLE device time to wake
+                        await asyncio.sleep(min(0.5 * attempt, 2.0))
 
         raise ConnectionError(
             f"Failed to communicate with Galcon device {self.address} "
             f"after {MAX_RETRIES} attempts: {last_error}"
         )
 
+    async def _write_wake(self, client: BleakClient) -> None:
+        """Write the wake payload.
+
+        The first wake of a connection is acknowledged as a handshake;
+        later ones skip the ATT write response when the device allows it.
+        """
+        response = not (self._wake_nores and self._session_woken)
+        await client.write_gatt_char(UUID_WAKE, WAKE_PAYLOAD, response=response)
+        self._session_woken = True
+        self._last_activity = time.monotonic()
+
     async def wake_up(self, client: BleakClient) -> None:
         """Send the wake-up command and wait for the device to settle."""
-        await client.write_gatt_char(UUID_WAKE, WAKE_PAYLOAD, response=True)
+        await self._write_wake(client)
         await asyncio.sleep(WAKE_SETTLE_DELAY)
         _LOGGER.debug("Wake-up sent to %s", self.address)
 
     async def _read_status_raw(self, client: BleakClient) -> GalconStatus:
         """Read status from an already-connected client (no wake-up)."""
-        data = await client.read_gatt_char(UUID_STATUS)
-        return self._parse_status(data)
+        data = await client.read_gatt_char(UUID_STATUS, **self._read_kwargs)
+        return self._remember_status(self._decode_status(data))
+
+    def _decode_status(self, data: bytes | bytearray) -> GalconStatus:
+        """Parse status bytes, reusing the previous result if unchanged."""
+        if data == self._last_raw and self._last_parsed is not None:
+            return self._last_parsed
+        raw = bytes(data)
+        self._last_raw = raw
+        self._last_parsed = self._parse_status(raw)
+        return self._last_parsed
+
+    def _remember_status(self, status: GalconStatus) -> GalconStatus:
+        """Record the latest status read from the device."""
+        self._last_status = status
+        self._last_status_ts = self._last_activity = time.monotonic()
+        return status
+
+    def _fresh_status(self) -> GalconStatus | None:
+        """Return the last status if it is younger than STATUS_FRESH_FOR."""
+        if (
+            self._last_status is not None
+            and time.monotonic() - self._last_status_ts < STATUS_FRESH_FOR
+        ):
+            return self._last_status
+        return None
 
     async def get_status(self) -> GalconStatus:
         """Read and parse the current status from the device."""
         async with self._lock:
+            return await self._execute(self._do_read_status)
 
-            async def _read(client: BleakClient) -> GalconStatus:
-                await self.wake_up(client)
-                return await self._read_status_raw(client)
+    async def _do_read_status(self, client: BleakClient) -> GalconStatus:
+        """Wake the device and read its status."""
+        await self.wake_up(client)
+        return await self._read_status_raw(client)
 
-            return await self._execute(_read)
+    async def _await_state(
+        self, client: BleakClient, expect_open: bool
+    ) -> GalconStatus | None:
+        """Read status with growing gaps until the valve reaches expect_open.
+
+        Starts probing after VERIFY_INITIAL_DELAY and backs off up to
+        VERIFY_MAX_DELAY between reads. Returns None after VERIFY_TIMEOUT.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + VERIFY_TIMEOUT
+        delay = VERIFY_INITIAL_DELAY
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                status = await self._read_status_raw(client)
+                _LOGGER.debug(
+                    "Post-command status on %s: valve_open=%s (expected %s)",
+                    self.address,
+                    status.valve_open,
+                    expect_open,
+                )
+                if status.valve_open == expect_open:
+                    return status
+            except (BleakError, asyncio.TimeoutError, OSError) as err:
+                _LOGGER.debug("Verify read failed on %s: %s", self.address, err)
+            if loop.time() >= deadline:
+                return None
+            delay = min(delay * 1.7, VERIFY_MAX_DELAY)
 
     async def _verified_command(
         self,
         client: BleakClient,
         payload: bytes,
         expect_open: bool,
-    ) -> GalconStatus | None:
+    ) -> CommandResult:
         """Send a command and verify the valve reached the expected state.
 
         Within a single BLE connection:
           1. Wake the device
-          2. Read current status (confirms device is responsive)
+          2. Read current status (skipped if read within STATUS_FRESH_FOR)
           3. Write the command
-          4. Wait for the device to process
-          5. Read status back and verify
-          6. Retry steps 3-5 up to COMMAND_VERIFY_ATTEMPTS times
+          4. Wait for a status notification confirming the new state, or
+             (without notifications) read status back with growing gaps
+             until it matches
+          5. Retry steps 3-4 up to COMMAND_VERIFY_ATTEMPTS times
 
-        Returns the post-command GalconStatus if successful, None otherwise.
+        Returns the post-command status (None if the write was never
+        confirmed) and whether the command was written at all.
         """
         await self.wake_up(client)
 
-        # Pre-read to make sure device is alive
-        pre_status = await self._read_status_raw(client)
+        # Pre-read to make sure device is alive, unless we just read it
+        pre_status = self._fresh_status()
+        if pre_status is None:
+            pre_status = await self._read_status_raw(client)
         _LOGGER.debug(
             "Pre-command status on %s: valve_open=%s",
             self.address,
@@ -171,7 +441,7 @@ class GalconDevice:
                 self.address,
                 "open" if expect_open else "closed",
             )
-            return pre_status
+            return CommandResult(pre_status, written=False)
 
         for attempt in range(1, COMMAND_VERIFY_ATTEMPTS + 1):
             _LOGGER.debug(
@@ -181,42 +451,42 @@ class GalconDevice:
                 attempt,
                 COMMAND_VERIFY_ATTEMPTS,
             )
-            await client.write_gatt_char(UUID_CONTROL, payload, response=True)
-            await asyncio.sleep(POST_COMMAND_DELAY)
-
-            # Re-wake before reading — the device may have gone back to
-            # sleep after processing the command, returning stale data.
-            try:
-                await client.write_gatt_char(UUID_WAKE, WAKE_PAYLOAD, response=True)
-                await asyncio.sleep(0.5)
-            except (BleakError, asyncio.TimeoutError, OSError):
-                pass  # Best effort; continue to read anyway
-
-            # Read back and verify
-            try:
-                post_status = await self._read_status_raw(client)
-                _LOGGER.debug(
-                    "Post-command status on %s: valve_open=%s (expected %s)",
-                    self.address,
-                    post_status.valve_open,
-                    expect_open,
-                )
+            self._status_event.clear()
+            await client.write_gatt_char(
+                UUID_CONTROL, payload, response=not self._control_nores
+            )
+            self._last_activity = time.monotonic()
 
-                if post_status.valve_open == expect_open:
+            # Prefer a pushed status; fall back to read-polling without one
+            if self._notify_enabled:
+                post_status = await self._wait_for_notified_status(expect_open)
+                if post_status is not None:
                     _LOGGER.info(
-                        "Valve %s confirmed on %s (attempt %d)",
+                        "Valve %s confirmed on %s by notification (attempt %d)",
                         "OPEN" if expect_open else "CLOSED",
                         self.address,
                         attempt,
                     )
-                    return post_status
-            except (BleakError, asyncio.TimeoutError, OSError) as err:
-                _LOGGER.debug(
-                    "Verify read failed on %s: %s", self.address, err
-                )
+                    return CommandResult(post_status, written=True)
 
-            # Not yet — give it a bit more time before retrying
-            await asyncio.sleep(1.0)
+            # Re-wake before reading if the link has been quiet long enough
+            # for the device to go back to sleep and return stale data.
+            if time.monotonic() - self._last_activity > WAKE_SETTLE_DELAY * 2:
+                try:
+                    await self._write_wake(client)
+                except (BleakError, asyncio.TimeoutError, OSError):
+                    pass  # Best effort; continue to read anyway
+
+            # Read back until the expected state shows up or we time out
+            post_status = await self._await_state(client, expect_open)
+            if post_status is not None:
+                _LOGGER.info(
+                    "Valve %s confirmed on %s (attempt %d)",
+                    "OPEN" if expect_open else "CLOSED",
+                    self.address,
+                    attempt,
+                )
+                return CommandResult(post_status, written=True)
 
         _LOGGER.warning(
             "Valve on %s did not confirm %s after %d attempts",
@@ -224,65 +494,96 @@ class GalconDevice:
             "open" if expect_open else "closed",
             COMMAND_VERIFY_ATTEMPTS,
         )
-        return False
+        return CommandResult(None, written=True)
 
     async def open_valve(
         self, hours: int = 0, minutes: int = 0, seconds: int = 0
-    ) -> GalconStatus | None:
+    ) -> CommandResult:
         """Open the irrigation valve with verified write.
 
-        Returns the post-command GalconStatus if available.
+        Returns the post-command status, if available, and whether the
+        command was written (False if the valve was already open).
         """
         async with self._lock:
+            if (fresh := self._fresh_status()) is not None and fresh.valve_open:
+                _LOGGER.info(
+                    "Valve on %s already open (fresh status), skipping command",
+                    self.address,
+                )
+                return CommandResult(fresh, written=False)
+
             if hours == 0 and minutes == 0 and seconds == 0:
                 payload = CMD_OPEN_VALVE
             else:
-                payload = bytes(
-                    [0x00, 0x03, 0x00, hours & 0xFF, minutes & 0xFF, seconds & 0xFF, 0x00]
-                )
-
-            async def _open(client: BleakClient) -> GalconStatus | None:
-                result = await self._verified_command(
-                    client, payload, expect_open=True
-                )
-                if not result:
-                    _LOGGER.warning(
-                        "Valve OPEN on %s sent but not confirmed by readback "
-                        "(command likely succeeded — device is slow to update)",
-                        self.address,
-                    )
-                _LOGGER.info(
-                    "Valve opened on %s (duration: %02d:%02d:%02d)",
-                    self.address,
-                    hours,
-                    minutes,
-                    seconds,
+                buf = bytearray(_OPEN_TIMED_TEMPLATE)
+                buf[3:6] = (hours & 0xFF, minutes & 0xFF, seconds & 0xFF)
+                payload = bytes(buf)
+
+            return await self._execute(
+                functools.partial(
+                    self._do_open,
+                    payload=payload,
+                    hours=hours,
+                    minutes=minutes,
+                    seconds=seconds,
                 )
-                return result
+            )
 
-            return await self._execute(_open)
+    async def _do_open(
+        self,
+        client: BleakClient,
+        *,
+        payload: bytes,
+        hours: int,
+        minutes: int,
+        seconds: int,
+    ) -> CommandResult:
+        """Send a verified OPEN command over an already-connected client."""
+        result = await self._verified_command(client, payload, expect_open=True)
+        if result.status is None:
+            _LOGGER.warning(
+                "Valve OPEN on %s sent but not confirmed by readback "
+                "(command likely succeeded — device is slow to update)",
+                self.address,
+            )
+        _LOGGER.info(
+            "Valve opened on %s (duration: %02d:%02d:%02d)",
+            self.address,
+            hours,
+            minutes,
+            seconds,
+        )
+        return result
 
-    async def close_valve(self) -> GalconStatus | None:
+    async def close_valve(self) -> CommandResult:
         """Close the irrigation valve with verified write.
 
-        Returns the post-command GalconStatus if available.
+        Returns the post-command status, if available, and whether the
+        command was written (False if the valve was already closed).
         """
         async with self._lock:
-
-            async def _close(client: BleakClient) -> GalconStatus | None:
-                result = await self._verified_command(
-                    client, CMD_CLOSE_VALVE, expect_open=False
+            if (fresh := self._fresh_status()) is not None and not fresh.valve_open:
+                _LOGGER.info(
+                    "Valve on %s already closed (fresh status), skipping command",
+                    self.address,
                 )
-                if not result:
-                    _LOGGER.warning(
-                        "Valve CLOSE on %s sent but not confirmed by readback "
-                        "(command likely succeeded — device is slow to update)",
-                        self.address,
-                    )
-                _LOGGER.info("Valve closed on %s", self.address)
-                return result
+                return CommandResult(fresh, written=False)
 
-            return await self._execute(_close)
+            return await self._execute(self._do_close)
+
+    async def _do_close(self, client: BleakClient) -> CommandResult:
+        """Send a verified CLOSE command over an already-connected client."""
+        result = await self._verified_command(
+            client, CMD_CLOSE_VALVE, expect_open=False
+        )
+        if result.status is None:
+            _LOGGER.warning(
+                "Valve CLOSE on %s sent but not confirmed by readback "
+                "(command likely succeeded — device is slow to update)",
+                self.address,
+            )
+        _LOGGER.info("Valve closed on %s", self.address)
+        return result
 
     @staticmethod
     def _parse_status(data: bytes) -> GalconStatus:
@@ -297,6 +598,21 @@ class GalconDevice:
             Byte 5: battery level (0-100%)
             Byte 6: unknown
         """
+        if len(data) >= _STATUS_STRUCT.size:
+            flags, manual, hours, minutes, seconds, battery = _STATUS_STRUCT.unpack_from(
+                data
+            )
+            return GalconStatus(
+                valve_open=bool(flags & STATUS_VALVE_OPEN_MASK),
+                manual_open=bool(manual & STATUS_MANUAL_OPEN_MASK),
+                hours_remaining=hours,
+                minutes_remaining=minutes,
+                seconds_remaining=seconds,
+                raw=data,
+                battery_level=battery,
+                raw_hex=data.hex(),
+            )
+
         if len(data) < 5:
             _LOGGER.warning("Unexpected status length: %d bytes", len(data))
             return GalconStatus(
@@ -306,21 +622,16 @@ class GalconDevice:
                 minutes_remaining=0,
                 seconds_remaining=0,
                 raw=data,
+                raw_hex=data.hex(),
             )
 
-        valve_open = bool(data[0] & STATUS_VALVE_OPEN_MASK)
-        manual_open = bool(data[1] & STATUS_MANUAL_OPEN_MASK) if len(data) > 1 else False
-        hours = data[2] if len(data) > 2 else 0
-        minutes = data[3] if len(data) > 3 else 0
-        seconds = data[4] if len(data) > 4 else 0
-        battery = data[5] if len(data) > 5 else None
-
+        # 5-byte status without the battery byte
         return GalconStatus(
-            valve_open=valve_open,
-            manual_open=manual_open,
-            hours_remaining=hours,
-            minutes_remaining=minutes,
-            seconds_remaining=seconds,
+            valve_open=bool(data[0] & STATUS_VALVE_OPEN_MASK),
+            manual_open=bool(data[1] & STATUS_MANUAL_OPEN_MASK),
+            hours_remaining=data[2],
+            minutes_remaining=data[3],
+            seconds_remaining=data[4],
             raw=data,
-            battery_level=battery,
+            raw_hex=data.hex(),
         )
@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_ADDRESS, CONF_DURATION, CONF_NAME, DEFAULT_DURATION, DEFAULT_NAME, DOMAIN
+from .const import CONF_ADDRESS, CONF_DURATION, DEFAULT_DURATION, DOMAIN
 from .coordinator import GalconCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,11 +24,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Galcon BT duration number entity."""
     coordinator: GalconCoordinator = hass.data[DOMAIN][entry.entry_id]
-    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
     address = entry.data[CONF_ADDRESS]
     default_duration = entry.data.get(CONF_DURATION, DEFAULT_DURATION)
 
-    async_add_entities([GalconDurationNumber(coordinator, name, address, default_duration)])
+    async_add_entities([GalconDurationNumber(coordinator, address, default_duration)])
 
 
 class GalconDurationNumber(NumberEntity):
@@ -46,7 +45,6 @@ class GalconDurationNumber(NumberEntity):
     def __init__(
         self,
         coordinator: GalconCoordinator,
-        name: str,
         address: str,
         default_duration: int,
     ) -> None:
@@ -54,19 +52,13 @@ class GalconDurationNumber(NumberEntity):
         self._coordinator = coordinator
         self._address = address
         self._attr_name = "Duration"
-        self._attr_unique_id = f"galcon_bt_{address.replace(':', '_').lower()}_duration"
+        self._attr_unique_id = f"galcon_bt_{coordinator.address_slug}_duration"
         self._attr_native_value = float(default_duration)
 
         # Store initial value on coordinator so valve can read it
         self._coordinator.duration_minutes = default_duration
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, address)},
-            "name": name,
-            "manufacturer": "Galcon",
-            "model": "9001BT",
-            "connections": {("bluetooth", address)},
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -3,27 +3,25 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_ADDRESS, CONF_NAME, DEFAULT_NAME, DOMAIN
+from .const import CONF_ADDRESS, DOMAIN
 from .coordinator import GalconCoordinator, OperationState
 from .galcon_device import GalconStatus
 
 _LOGGER = logging.getLogger(__name__)
 
-import datetime as dt
-
 # Map operation states to mdi icons for visual feedback
-STATE_ICONS: dict[OperationState, str] = {
+STATE_ICONS: dict[str, str] = {
     OperationState.IDLE: "mdi:sleep",
     OperationState.CONNECTING: "mdi:bluetooth-connect",
     OperationState.OPENING: "mdi:valve-open",
@@ -42,14 +40,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Galcon BT operation status sensor."""
     coordinator: GalconCoordinator = hass.data[DOMAIN][entry.entry_id]
-    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
     address = entry.data[CONF_ADDRESS]
 
     async_add_entities([
-        GalconOperationSensor(coordinator, name, address),
-        GalconTimeRemainingSensor(coordinator, name, address),
-        GalconBatterySensor(coordinator, name, address),
-        GalconLastIrrigationSensor(coordinator, name, address),
+        GalconOperationSensor(coordinator, address),
+        GalconTimeRemainingSensor(coordinator, address),
+        GalconBatterySensor(coordinator, address),
+        GalconLastIrrigationSensor(coordinator, address),
     ])
 
 
@@ -65,35 +62,28 @@ class GalconOperationSensor(SensorEntity):
     def __init__(
         self,
         coordinator: GalconCoordinator,
-        name: str,
         address: str,
     ) -> None:
         """Initialize the operation status sensor."""
         self._coordinator = coordinator
         self._address = address
         self._attr_name = "Status"
-        self._attr_unique_id = f"galcon_bt_{address.replace(':', '_').lower()}_status"
-        self._attr_icon = STATE_ICONS[OperationState.IDLE]
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, address)},
-            "name": name,
-            "manufacturer": "Galcon",
-            "model": "9001BT",
-            "connections": {("bluetooth", address)},
-        }
+        self._attr_unique_id = f"galcon_bt_{coordinator.address_slug}_status"
+        self._update_from_operation_state()
 
-    @property
-    def native_value(self) -> str:
-        """Return the current operation state as a string."""
-        return str(self._coordinator.operation_state)
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def icon(self) -> str:
-        """Return an icon matching the current operation phase."""
-        return STATE_ICONS.get(
-            self._coordinator.operation_state, "mdi:help-circle-outline"
-        )
+    def _update_from_operation_state(self) -> None:
+        """Cache the value and icon for the coordinator's operation state."""
+        state = self._coordinator.operation_state
+        self._attr_native_value = state
+        self._attr_icon = STATE_ICONS.get(state, "mdi:help-circle-outline")
+
+    @callback
+    def _on_state_change(self) -> None:
+        """Push a state update when the operation phase changes."""
+        self._update_from_operation_state()
+        self.async_write_ha_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -102,8 +92,8 @@ class GalconOperationSensor(SensorEntity):
             "scanning_enabled": self._coordinator.polling_enabled,
             "consecutive_failures": self._coordinator.consecutive_failures,
         }
-        if self._coordinator.last_successful_poll is not None:
-            attrs["last_seen"] = self._coordinator.last_successful_poll.isoformat()
+        if self._coordinator.last_successful_poll_iso is not None:
+            attrs["last_seen"] = self._coordinator.last_successful_poll_iso
         return attrs
 
     @property
@@ -112,15 +102,15 @@ class GalconOperationSensor(SensorEntity):
         return True
 
     async def async_added_to_hass(self) -> None:
-        """Register for operation state change callbacks."""
+        """Subscribe to operation state change signals."""
         await super().async_added_to_hass()
-
-        @callback
-        def _on_state_change() -> None:
-            """Push a state update when the operation phase changes."""
-            self.async_write_ha_state()
-
-        self._coordinator.register_state_listener(_on_state_change)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self._coordinator.operation_state_signal,
+                self._on_state_change,
+            )
+        )
 
 
 class GalconTimeRemainingSensor(CoordinatorEntity[GalconCoordinator], SensorEntity):
@@ -137,36 +127,38 @@ class GalconTimeRemainingSensor(CoordinatorEntity[GalconCoordinator], SensorEnti
     def __init__(
         self,
         coordinator: GalconCoordinator,
-        name: str,
         address: str,
     ) -> None:
         """Initialize the time remaining sensor."""
         super().__init__(coordinator)
         self._address = address
         self._attr_name = "Time Remaining"
-        self._attr_unique_id = (
-            f"galcon_bt_{address.replace(':', '_').lower()}_time_remaining"
-        )
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, address)},
-            "name": name,
-            "manufacturer": "Galcon",
-            "model": "9001BT",
-            "connections": {("bluetooth", address)},
-        }
+        self._attr_unique_id = f"galcon_bt_{coordinator.address_slug}_time_remaining"
+        self._attr_device_info = coordinator.device_info
 
         # Local countdown state
-        self._end_time: datetime | None = None
+        self._end_monotonic: float | None = None  # loop.time() deadline
         self._unsub_timer: callback | None = None
+        # Values rendered for the current tick, shared by native_value/icon
+        self._cached_seconds: int = 0
+        self._cached_text: str = self._format_time(0)
 
     # ---- helpers ----
 
     def _remaining_seconds(self) -> int:
         """Seconds left according to local countdown."""
-        if self._end_time is None:
+        if self._end_monotonic is None:
             return 0
-        remaining = (self._end_time - datetime.now(timezone.utc)).total_seconds()
-        return max(0, int(remaining))
+        return max(0, int(self._end_monotonic - self.hass.loop.time()))
+
+    def _refresh_cache(self) -> bool:
+        """Recompute the countdown once; return True if it changed."""
+        seconds = self._remaining_seconds()
+        if seconds == self._cached_seconds:
+            return False
+        self._cached_seconds = seconds
+        self._cached_text = self._format_time(seconds)
+        return True
 
     @staticmethod
     def _format_time(total_seconds: int) -> str:
@@ -184,12 +176,12 @@ class GalconTimeRemainingSensor(CoordinatorEntity[GalconCoordinator], SensorEnti
     @property
     def native_value(self) -> str:
         """Return formatted time remaining."""
-        return self._format_time(self._remaining_seconds())
+        return self._cached_text
 
     @property
     def icon(self) -> str:
         """Show timer icon when counting, check when done."""
-        if self._remaining_seconds() > 0:
+        if self._cached_seconds > 0:
             return "mdi:timer-sand"
         return "mdi:timer-outline"
 
@@ -204,35 +196,36 @@ class GalconTimeRemainingSensor(CoordinatorEntity[GalconCoordinator], SensorEnti
         status: GalconStatus | None = self.coordinator.data
         if status is not None and status.valve_open and status.time_remaining_seconds > 0:
             # Set / refresh the projected end time from device data
-            self._end_time = datetime.now(timezone.utc) + dt.timedelta(
-                seconds=status.time_remaining_seconds
-            )
+            self._end_monotonic = self.hass.loop.time() + status.time_remaining_seconds
             self._ensure_timer()
         elif status is not None and not status.valve_open:
             # Valve closed — clear countdown
-            self._end_time = None
+            self._end_monotonic = None
             self._cancel_timer()
+        self._refresh_cache()
         super()._handle_coordinator_update()
 
     @callback
-    def _tick(self, _now: datetime) -> None:
-        """Called every second to update the displayed countdown."""
-        if self._remaining_seconds() <= 0:
-            self._end_time = None
+    def _tick(self) -> None:
+        """Called every second by the coordinator's shared countdown tick."""
+        changed = self._refresh_cache()
+        if self._cached_seconds <= 0:
+            self._end_monotonic = None
             self._cancel_timer()
-            # Irrigation finished — update valve status and disable scanning
+            # Irrigation finished — update valve status and disable scanning;
+            # the resulting coordinator update writes our state.
             self.coordinator.async_irrigation_ended()
-        self.async_write_ha_state()
+            return
+        if changed:
+            self.async_write_ha_state()
 
     def _ensure_timer(self) -> None:
-        """Start the 1-second tick if not already running."""
+        """Subscribe to the coordinator's 1 Hz tick if not already."""
         if self._unsub_timer is None:
-            self._unsub_timer = async_track_time_interval(
-                self.hass, self._tick, dt.timedelta(seconds=1)
-            )
+            self._unsub_timer = self.coordinator.async_add_tick_listener(self._tick)
 
     def _cancel_timer(self) -> None:
-        """Stop the 1-second tick."""
+        """Unsubscribe from the countdown tick."""
         if self._unsub_timer is not None:
             self._unsub_timer()
             self._unsub_timer = None
@@ -257,31 +250,27 @@ class GalconBatterySensor(CoordinatorEntity[GalconCoordinator], SensorEntity):
     def __init__(
         self,
         coordinator: GalconCoordinator,
-        name: str,
         address: str,
     ) -> None:
         """Initialize the battery sensor."""
         super().__init__(coordinator)
         self._address = address
         self._attr_name = "Battery"
-        self._attr_unique_id = (
-            f"galcon_bt_{address.replace(':', '_').lower()}_battery"
-        )
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, address)},
-            "name": name,
-            "manufacturer": "Galcon",
-            "model": "9001BT",
-            "connections": {("bluetooth", address)},
-        }
+        self._attr_unique_id = f"galcon_bt_{coordinator.address_slug}_battery"
+        self._attr_device_info = coordinator.device_info
         self._cached_battery: int | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Cache battery level from fresh poll data."""
+        """Cache battery level from fresh poll data, writing only on change."""
         status: GalconStatus | None = self.coordinator.data
-        if status is not None and status.battery_level is not None:
-            self._cached_battery = status.battery_level
+        if (
+            status is None
+            or status.battery_level is None
+            or status.battery_level == self._cached_battery
+        ):
+            return
+        self._cached_battery = status.battery_level
         super()._handle_coordinator_update()
 
     @property
@@ -308,23 +297,27 @@ class GalconLastIrrigationSensor(CoordinatorEntity[GalconCoordinator], SensorEnt
     def __init__(
         self,
         coordinator: GalconCoordinator,
-        name: str,
         address: str,
     ) -> None:
         """Initialize the last irrigation sensor."""
         super().__init__(coordinator)
         self._address = address
         self._attr_name = "Last Irrigation"
-        self._attr_unique_id = (
-            f"galcon_bt_{address.replace(':', '_').lower()}_last_irrigation"
+        self._attr_unique_id = f"galcon_bt_{coordinator.address_slug}_last_irrigation"
+        self._attr_device_info = coordinator.device_info
+        self._last_written: tuple[datetime | None, int | None] = (None, None)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a new irrigation has been recorded."""
+        current = (
+            self.coordinator.last_irrigation_start,
+            self.coordinator.last_irrigation_duration_min,
         )
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, address)},
-            "name": name,
-            "manufacturer": "Galcon",
-            "model": "9001BT",
-            "connections": {("bluetooth", address)},
-        }
+        if current == self._last_written:
+            return
+        self._last_written = current
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str | None:
@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_ADDRESS, CONF_NAME, DEFAULT_NAME, DOMAIN
+from .const import CONF_ADDRESS, DOMAIN
 from .coordinator import GalconCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,11 +26,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up Galcon BT switch from a config entry."""
     coordinator: GalconCoordinator = hass.data[DOMAIN][entry.entry_id]
-    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
     address = entry.data[CONF_ADDRESS]
 
     async_add_entities(
-        [GalconPollingSwitch(coordinator, name, address, entry.entry_id)]
+        [GalconPollingSwitch(coordinator, address, entry.entry_id)]
     )
 
 
@@ -47,7 +47,6 @@ class GalconPollingSwitch(CoordinatorEntity[GalconCoordinator], SwitchEntity):
     def __init__(
         self,
         coordinator: GalconCoordinator,
-        name: str,
         address: str,
         entry_id: str,
     ) -> None:
@@ -55,16 +54,11 @@ class GalconPollingSwitch(CoordinatorEntity[GalconCoordinator], SwitchEntity):
         super().__init__(coordinator)
         self._address = address
         self._attr_name = "Scanning"
-        self._attr_unique_id = f"galcon_bt_{address.replace(':', '_').lower()}_scanning"
+        self._attr_unique_id = f"galcon_bt_{coordinator.address_slug}_scanning"
         self._attr_icon = "mdi:bluetooth-connect"
+        self._last_written: tuple[bool, datetime | None] | None = None
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, address)},
-            "name": name,
-            "manufacturer": "Galcon",
-            "model": "9001BT",
-            "connections": {("bluetooth", address)},
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -76,18 +70,33 @@ class GalconPollingSwitch(CoordinatorEntity[GalconCoordinator], SwitchEntity):
         """Scanning toggle is always available."""
         return True
 
+    async def async_added_to_hass(self) -> None:
+        """Register this entity so the timed-open service can find its device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_register_entity(self.entity_id))
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Show scanning diagnostics."""
         attrs: dict[str, Any] = {
             "polling_interval_seconds": self.coordinator._base_interval,
         }
-        if self.coordinator.last_successful_poll is not None:
-            attrs["last_successful_poll"] = (
-                self.coordinator.last_successful_poll.isoformat()
-            )
+        if self.coordinator.last_successful_poll_iso is not None:
+            attrs["last_successful_poll"] = self.coordinator.last_successful_poll_iso
         return attrs
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the toggle or its diagnostics changed."""
+        current = (
+            self.coordinator.polling_enabled,
+            self.coordinator.last_successful_poll,
+        )
+        if current == self._last_written:
+            return
+        self._last_written = current
+        super()._handle_coordinator_update()
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable BLE scanning."""
         _LOGGER.info("Enabling Galcon BLE scanning for %s", self._address)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 from homeassistant.components.valve import (
@@ -11,11 +13,23 @@ from homeassistant.components.valve import (
     ValveEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_ADDRESS, CONF_NAME, DEFAULT_NAME, DOMAIN
+from .const import (
+    ATTR_BLUETOOTH_ADDRESS,
+    ATTR_CONSECUTIVE_POLL_FAILURES,
+    ATTR_HOURS_REMAINING,
+    ATTR_LAST_SEEN,
+    ATTR_MANUAL_OPEN,
+    ATTR_MINUTES_REMAINING,
+    ATTR_RAW_STATUS,
+    ATTR_SECONDS_REMAINING,
+    ATTR_TIME_REMAINING_TOTAL_SECONDS,
+    CONF_ADDRESS,
+    DOMAIN,
+)
 from .coordinator import GalconCoordinator
 from .galcon_device import GalconStatus
 
@@ -29,15 +43,17 @@ async def async_setup_entry(
 ) -> None:
     """Set up Galcon BT valve from a config entry."""
     coordinator: GalconCoordinator = hass.data[DOMAIN][entry.entry_id]
-    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
     address = entry.data[CONF_ADDRESS]
 
-    async_add_entities([GalconValve(coordinator, name, address, entry.entry_id)])
+    async_add_entities([GalconValve(coordinator, address, entry.entry_id)])
 
 
 class GalconValve(CoordinatorEntity[GalconCoordinator], ValveEntity):
     """Representation of a Galcon irrigation valve."""
 
+    # The HA base classes keep a __dict__, so this only slots our own field
+    __slots__ = ("_address",)
+
     _attr_device_class = ValveDeviceClass.WATER
     _attr_supported_features = ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE
     _attr_has_entity_name = True
@@ -46,7 +62,6 @@ class GalconValve(CoordinatorEntity[GalconCoordinator], ValveEntity):
     def __init__(
         self,
         coordinator: GalconCoordinator,
-        name: str,
         address: str,
         entry_id: str,
     ) -> None:
@@ -54,72 +69,108 @@ class GalconValve(CoordinatorEntity[GalconCoordinator], ValveEntity):
         super().__init__(coordinator)
         self._address = address
         self._attr_name = "Valve"
-        self._attr_unique_id = f"galcon_bt_{address.replace(':', '_').lower()}_valve"
-
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, address)},
-            "name": name,
-            "manufacturer": "Galcon",
-            "model": "9001BT",
-            "connections": {("bluetooth", address)},
-        }
+        self._attr_unique_id = f"galcon_bt_{coordinator.address_slug}_valve"
 
-    @property
-    def is_closed(self) -> bool | None:
-        """Return True if the valve is closed."""
-        status: GalconStatus | None = self.coordinator.data
-        if status is None:
-            return None
-        return not status.valve_open
+        self._attr_device_info = coordinator.device_info
+        self._update_from_coordinator()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def _update_from_coordinator(self) -> None:
+        """Snapshot availability, closed state and attributes from the coordinator."""
         status: GalconStatus | None = self.coordinator.data
-        attrs: dict[str, Any] = {
-            "bluetooth_address": self._address,
-            "consecutive_poll_failures": self.coordinator.consecutive_failures,
+        # Available when scanning is on, or when we have a cached status
+        self._attr_available = (
+            self.coordinator.polling_enabled or status is not None
+        )
+        self._attr_is_closed = None if status is None else not status.valve_open
+        # Every key is always present (None when unknown) so the dict is
+        # built in one literal
+        self._attr_extra_state_attributes = {
+            ATTR_BLUETOOTH_ADDRESS: self._address,
+            ATTR_CONSECUTIVE_POLL_FAILURES: self.coordinator.consecutive_failures,
+            ATTR_LAST_SEEN: self.coordinator.last_successful_poll_iso,
+            ATTR_MANUAL_OPEN: status.manual_open if status is not None else None,
+            ATTR_HOURS_REMAINING: (
+                status.hours_remaining if status is not None else None
+            ),
+            ATTR_MINUTES_REMAINING: (
+                status.minutes_remaining if status is not None else None
+            ),
+            ATTR_SECONDS_REMAINING: (
+                status.seconds_remaining if status is not None else None
+            ),
+            ATTR_TIME_REMAINING_TOTAL_SECONDS: (
+                status.time_remaining_seconds if status is not None else None
+            ),
+            ATTR_RAW_STATUS: status.raw_hex if status is not None else None,
         }
-        if self.coordinator.last_successful_poll is not None:
-            attrs["last_seen"] = self.coordinator.last_successful_poll.isoformat()
-        if status is not None:
-            attrs["manual_open"] = status.manual_open
-            attrs["hours_remaining"] = status.hours_remaining
-            attrs["minutes_remaining"] = status.minutes_remaining
-            attrs["seconds_remaining"] = status.seconds_remaining
-            attrs["time_remaining_total_seconds"] = status.time_remaining_seconds
-            attrs["raw_status"] = status.raw.hex()
-        return attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the state snapshot before writing the new state."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
-        """Available when scanning is on, or when we have a cached status."""
-        return self.coordinator.polling_enabled or self.coordinator.data is not None
+        """Return the availability snapshotted on the last coordinator update."""
+        return self._attr_available
+
+    async def async_added_to_hass(self) -> None:
+        """Register this entity so the timed-open service can find its device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_register_entity(self.entity_id))
 
     async def async_open_valve(self, **kwargs: Any) -> None:
         """Open the irrigation valve using the configured duration."""
-        duration = self.coordinator.duration_minutes
-        hours, remainder = divmod(duration * 60, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        if self.hass.is_stopping:
+            _LOGGER.debug("Skipping open on %s: Home Assistant is stopping", self._address)
+            return
+        hours, minutes, seconds = self.coordinator.duration_hms
         _LOGGER.info(
-            "Opening valve on %s for %d min (%02d:%02d:%02d)",
+            "Opening valve on %s for %d min (%s)",
             self._address,
-            duration,
-            hours,
-            minutes,
-            seconds,
+            self.coordinator.duration_minutes,
+            self.coordinator.duration_label,
+        )
+        self._start_command(
+            "open",
+            functools.partial(
+                self.coordinator.async_open_valve,
+                hours=hours,
+                minutes=minutes,
+                seconds=seconds,
+            ),
         )
-        try:
-            await self.coordinator.async_open_valve(
-                hours=hours, minutes=minutes, seconds=seconds
-            )
-        except ConnectionError as err:
-            _LOGGER.error("Failed to open valve: %s", err)
 
     async def async_close_valve(self, **kwargs: Any) -> None:
         """Close the irrigation valve."""
+        if self.hass.is_stopping:
+            _LOGGER.debug("Skipping close on %s: Home Assistant is stopping", self._address)
+            return
         _LOGGER.info("Closing valve on %s", self._address)
-        try:
-            await self.coordinator.async_close_valve()
-        except ConnectionError as err:
-            _LOGGER.error("Failed to close valve: %s", err)
+        self._start_command("close", self.coordinator.async_close_valve)
+
+    def _start_command(
+        self, action: str, command: Callable[[], Coroutine[Any, Any, bool]]
+    ) -> None:
+        """Run a valve command in the background so the service call returns.
+
+        Progress, failures and the COMMAND_TIMEOUT bound are handled by the
+        coordinator and reported through its operation state (shown by the
+        Status sensor).
+        """
+        self.hass.async_create_background_task(
+            self._async_run_command(command),
+            name=f"galcon_{action}_{self._address}",
+        )
+
+    @staticmethod
+    async def _async_run_command(
+        command: Callable[[], Coroutine[Any, Any, bool]],
+    ) -> None:
+        """Create and await the command coroutine inside the task.
+
+        Creating it here means a task cancelled before it starts leaves no
+        never-awaited coroutine behind.
+        """
+        await command()